@@ -3,13 +3,43 @@ Polymarket CLOB API client wrapper using py-clob-client.
 Handles all trading operations including placing orders, checking balances, and order management.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterable, NamedTuple, TypeVar
 from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
+import time
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, AssetType, BalanceAllowanceParams
+from py_clob_client.clob_types import OrderArgs, OrderType, PostOrdersArgs, AssetType, BalanceAllowanceParams
 from py_clob_client.constants import POLYGON
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# CLOB GTD security threshold: a GTD order stops resting this many seconds
+# before the expiration it was signed with
+GTD_MIN_LIFETIME_SECONDS = 60
+
+
+class OpenOrder(NamedTuple):
+    """Open order from the CLOB, reduced to the fields the bot reads."""
+    id: Optional[str]
+    asset_id: Optional[str]
+    side: Optional[str]
+    original_size: str
+    price: str
+
+    @classmethod
+    def from_api(cls, raw: Dict[str, Any]) -> "OpenOrder":
+        """Build from a raw CLOB order dict (missing sizes/prices default to '0')."""
+        return cls(
+            id=raw.get('id'),
+            asset_id=raw.get('asset_id'),
+            side=raw.get('side'),
+            original_size=raw.get('original_size') or '0',
+            price=raw.get('price') or '0'
+        )
+
 
 class PolymarketClient:
     """
@@ -22,7 +52,8 @@ class PolymarketClient:
         private_key: str,
         chain_id: int = 137,
         rpc_url: Optional[str] = None,
-        proxy_address: Optional[str] = None
+        proxy_address: Optional[str] = None,
+        max_concurrent_requests: int = 25
     ):
         """
         Initialize Polymarket CLOB client.
@@ -34,10 +65,20 @@ class PolymarketClient:
             proxy_address: Polymarket proxy wallet address (for UI trading with GNOSIS_SAFE)
                           If provided, uses signature_type=2 and this as funder
                           If None, uses signature_type=0 (EOA direct trading)
+            max_concurrent_requests: Max independent requests in flight at once
         """
         self.chain_id = chain_id
         self.proxy_address = proxy_address
 
+        # Shared worker pool for issuing independent requests concurrently
+        self._request_pool = ThreadPoolExecutor(max_workers=max_concurrent_requests)
+
+        # Latest CLOB rate limit headers: (limit, remaining, reset_at epoch seconds)
+        self._rate_limit: Optional[tuple] = None
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self.rate_limit_threshold = 0.2
+
         # Initialize CLOB client
         host = "https://clob.polymarket.com"
         key = private_key if not private_key.startswith("0x") else private_key[2:]
@@ -65,6 +106,7 @@ class PolymarketClient:
 
         # Get API credentials
         self._setup_api_credentials()
+        self._setup_rate_limit_tracking()
 
     def _setup_api_credentials(self):
         """Setup API credentials with the CLOB"""
@@ -83,6 +125,93 @@ class PolymarketClient:
         except Exception as e:
             print(f"Note: API credentials setup: {e}")
 
+    def _setup_rate_limit_tracking(self):
+        """Record X-RateLimit-* headers from every CLOB response"""
+        try:
+            # py-clob-client sends all requests through one shared httpx client
+            from py_clob_client.http_helpers import helpers
+
+            http_client = helpers._http_client
+            hooks = http_client.event_hooks
+            hooks.setdefault('response', []).append(self._record_rate_limit)
+            http_client.event_hooks = hooks
+        except Exception as e:
+            print(f"Note: rate limit tracking unavailable: {e}")
+
+    def _record_rate_limit(self, response):
+        """Store rate limit state from a CLOB response's headers."""
+        headers = response.headers
+        try:
+            limit = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+
+        # Reset may be an epoch timestamp or seconds until the window resets
+        reset_at = reset if reset > 1e9 else time.time() + reset
+        with self._rate_limit_lock:
+            # Responses to in-flight requests can arrive out of order; within
+            # the same window keep the lower of the local and reported counts
+            if self._rate_limit and abs(self._rate_limit[2] - reset_at) < 1:
+                remaining = min(remaining, self._rate_limit[1])
+            self._rate_limit = (limit, remaining, reset_at)
+
+    def wait_for_rate_limit(self):
+        """
+        Pace requests when the rate limit window is nearly used up.
+
+        Each admitted request is counted against the last known remaining
+        budget until the next response header updates it. When fewer than
+        rate_limit_threshold of the requests remain, callers are handed
+        start slots one interval apart so the remainder is spread evenly
+        until the window resets.
+        """
+        with self._rate_limit_lock:
+            if not self._rate_limit:
+                return
+
+            limit, remaining, reset_at = self._rate_limit
+            now = time.time()
+            if reset_at <= now:
+                return
+
+            self._rate_limit = (limit, max(remaining - 1, 0), reset_at)
+            if remaining >= limit * self.rate_limit_threshold:
+                return
+
+            start_at = min(max(now, self._next_request_at), reset_at)
+            interval = (reset_at - start_at) / max(remaining, 1)
+            self._next_request_at = start_at + interval
+
+        # Sleep outside the lock so other callers can claim later slots
+        delay = start_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def map_concurrently(self, fn: Callable[[T], R], items: Iterable[T], paced: bool = True) -> List[R]:
+        """
+        Run an I/O-bound call for each item on the shared worker pool.
+        CLOB calls are paced by wait_for_rate_limit first.
+
+        Args:
+            fn: Function to call per item (should handle its own errors)
+            items: Items to process
+            paced: Apply the CLOB rate limit gate (False for calls to other APIs)
+
+        Returns:
+            Results in the same order as items
+        """
+        def call(item):
+            if paced:
+                self.wait_for_rate_limit()
+            return fn(item)
+
+        items = list(items)
+        if len(items) <= 1:
+            return [call(item) for item in items]
+        return list(self._request_pool.map(call, items))
+
     def get_balance(self) -> Decimal:
         """
         Get USDC.e (Polygon Bridged USDC) balance for trading.
@@ -134,6 +263,19 @@ class PolymarketClient:
             print(f"Error getting token balance for {token_id}: {e}")
             return Decimal("0")
 
+    def get_token_balances(self, token_ids: List[str]) -> Dict[str, Decimal]:
+        """
+        Get balances for several outcome tokens, one request per unique token.
+
+        Args:
+            token_ids: Outcome token IDs (duplicates are fetched once, in parallel)
+
+        Returns:
+            Dict of token_id -> balance as Decimal
+        """
+        unique_ids = list(dict.fromkeys(token_ids))
+        return dict(zip(unique_ids, self.map_concurrently(self.get_token_balance, unique_ids)))
+
     def get_midpoint_price(self, token_id: str) -> Optional[Decimal]:
         """
         Get current midpoint price for a token.
@@ -240,7 +382,8 @@ class PolymarketClient:
         self,
         token_id: str,
         price: Decimal,
-        amount_usdc: Decimal
+        amount_usdc: Decimal,
+        expires_at: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Place a limit buy order at specific price.
@@ -249,6 +392,8 @@ class PolymarketClient:
             token_id: The outcome token ID to buy
             price: Limit price (0.0 to 1.0)
             amount_usdc: Amount in USDC to spend
+            expires_at: Optional unix timestamp when the order should stop
+                        resting (GTD); must be in the future. If None, GTC.
 
         Returns:
             Order response or None if failed
@@ -262,11 +407,16 @@ class PolymarketClient:
                 token_id=token_id,
                 price=float(price),
                 size=size,
-                side="BUY"
+                side="BUY",
+                expiration=self._gtd_expiration(expires_at)
             )
 
             # Create and post order to CLOB
-            response = self.client.create_and_post_order(order_args)
+            if expires_at:
+                order = self.client.create_order(order_args)
+                response = self.client.post_order(order, OrderType.GTD)
+            else:
+                response = self.client.create_and_post_order(order_args)
 
             print(f"Limit BUY order placed: {amount_usdc} USDC at {price} for {token_id}")
             return response
@@ -275,6 +425,73 @@ class PolymarketClient:
             print(f"Error placing limit buy: {e}")
             return None
 
+    def _gtd_expiration(self, expires_at: Optional[int]) -> int:
+        """
+        Convert when an order should stop resting into the signed GTD expiration.
+
+        Returns:
+            expires_at plus the CLOB security threshold, or 0 for GTC orders
+        """
+        if not expires_at:
+            return 0
+        return int(expires_at) + GTD_MIN_LIFETIME_SECONDS
+
+    def place_limit_buys_batch(
+        self,
+        specs: List[Dict[str, Any]],
+        expires_at: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Place several limit buy orders in a single POST /orders request.
+
+        Each order is signed locally, then all of them are submitted together
+        so N entries cost one round-trip instead of N and land at the same time.
+
+        Args:
+            specs: List of dicts with 'token_id', 'price' and 'amount_usd'
+            expires_at: Optional unix timestamp when all orders stop resting
+                        (GTD); must be in the future. If None, orders are GTC.
+
+        Returns:
+            List of per-order responses aligned with specs (None where the
+            order could not be signed or the batch request failed)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+        signed = []  # (spec index, PostOrdersArgs)
+        order_type = OrderType.GTD if expires_at else OrderType.GTC
+        expiration = self._gtd_expiration(expires_at)
+
+        for i, spec in enumerate(specs):
+            try:
+                price = spec['price']
+                order_args = OrderArgs(
+                    token_id=spec['token_id'],
+                    price=float(price),
+                    size=float(spec['amount_usd'] / price),
+                    side="BUY",
+                    expiration=expiration
+                )
+                order = self.client.create_order(order_args)
+                signed.append((i, PostOrdersArgs(order=order, orderType=order_type)))
+            except Exception as e:
+                print(f"Error signing limit buy for {spec.get('token_id')}: {e}")
+
+        if not signed:
+            return results
+
+        try:
+            responses = self.client.post_orders([args for _, args in signed])
+        except Exception as e:
+            print(f"Error placing limit buy batch: {e}")
+            return results
+
+        # Batch endpoint returns one status object per submitted order, in order
+        for (i, _), response in zip(signed, responses or []):
+            results[i] = response
+
+        print(f"Limit BUY batch placed: {len(signed)} orders")
+        return results
+
     def place_limit_sell(
         self,
         token_id: str,
@@ -376,7 +593,7 @@ class PolymarketClient:
             print(f"Error cancelling order {order_id}: {e}")
             return False
 
-    def get_open_orders(self, token_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_open_orders(self, token_id: Optional[str] = None) -> List[OpenOrder]:
         """
         Get all open orders, optionally filtered by token.
 
@@ -384,13 +601,14 @@ class PolymarketClient:
             token_id: Optional token ID to filter by
 
         Returns:
-            List of open orders
+            List of open orders as OpenOrder tuples (attribute access)
         """
         try:
-            orders = self.client.get_orders()
+            from_api = OpenOrder.from_api
+            orders = [from_api(o) for o in self.client.get_orders()]
 
             if token_id:
-                orders = [o for o in orders if o.get("asset_id") == token_id]
+                orders = [o for o in orders if o.asset_id == token_id]
 
             return orders
         except Exception as e:
@@ -2,10 +2,52 @@
 Trade Executor - Execute trades based on strategy signals
 """
 
-from typing import Dict, List, Optional
+import sys
+import time
+from collections import Counter, defaultdict
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
-from src.api.polymarket_client import PolymarketClient
+from src.api.polymarket_client import OpenOrder, PolymarketClient
 from src.monitor.order_monitor import OrderMonitor
+from src.utils.decimal_utils import cents_to_price, to_decimal
+
+_ZERO = Decimal("0")
+_MIN_POSITION = Decimal("0.1")
+
+
+def index_open_orders(open_orders: List[OpenOrder]) -> Tuple[Counter, Dict[str, Decimal]]:
+    """
+    Summarize open orders per token in a single pass.
+
+    Args:
+        open_orders: Open orders from CLOB
+
+    Returns:
+        Tuple of (open BUY order count by asset_id, total SELL size by asset_id)
+    """
+    buy_count_by_asset: Counter = Counter()
+    sell_size_by_asset: Dict[str, Decimal] = defaultdict(Decimal)
+
+    for order in open_orders:
+        side = order.side
+        if side == 'BUY':
+            buy_count_by_asset[order.asset_id] += 1
+        elif side == 'SELL':
+            sell_size_by_asset[order.asset_id] += to_decimal(order.original_size)
+
+    return buy_count_by_asset, sell_size_by_asset
+
+
+def _flushes_output(method):
+    """Write the executor's buffered console output when the method returns."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._flush_output()
+    return wrapper
 
 
 class TradeExecutor:
@@ -28,55 +70,122 @@ class TradeExecutor:
         self.market_scanner = market_scanner
         self.market_queue = market_queue
 
-    def place_entry_orders(self, orders: List[Dict], strong_team_price_cents: float = None) -> List[str]:
+        # Open orders snapshot shared by the checks within one cycle
+        self.open_orders_ttl_seconds = 1.0
+        self._open_orders_snapshot: Optional[Tuple[float, List[OpenOrder]]] = None
+
+        # Console lines collected during a check, written out in one call
+        self._output: List[str] = []
+
+    def _log(self, message: str = ""):
+        """Queue a console line (written on the next _flush_output)."""
+        self._output.append(message)
+
+    def _flush_output(self):
+        """
+        Write queued console lines to stdout in a single call.
+
+        Called before API requests so output stays in order with the
+        client's own messages.
+        """
+        if self._output:
+            sys.stdout.write("\n".join(self._output) + "\n")
+            self._output.clear()
+
+    def _get_open_orders_cached(self) -> List[OpenOrder]:
+        """
+        Get open orders, reusing the last snapshot if it is still fresh.
+
+        Returns:
+            List of open orders from CLOB
+        """
+        now = time.monotonic()
+        if self._open_orders_snapshot is not None:
+            fetched_at, open_orders = self._open_orders_snapshot
+            if now - fetched_at < self.open_orders_ttl_seconds:
+                return open_orders
+
+        self.client.wait_for_rate_limit()
+        open_orders = self.client.get_open_orders()
+        self._open_orders_snapshot = (now, open_orders)
+        return open_orders
+
+    def _invalidate_open_orders(self):
+        """Drop the open orders snapshot after placing or cancelling orders."""
+        self._open_orders_snapshot = None
+
+    @_flushes_output
+    def place_entry_orders(
+        self,
+        orders: List[Dict],
+        strong_team_price_cents: float = None,
+        expire_after_seconds: Optional[int] = None
+    ) -> List[str]:
         """
-        Place entry limit buy orders.
+        Place entry limit buy orders together in one batch.
 
         Args:
             orders: List of order specifications from strategy
             strong_team_price_cents: Strong team price when entry was made (for TP calculation)
+            expire_after_seconds: If set, all entries are GTD and stop resting this
+                                  many seconds after placement (None = GTC)
 
         Returns:
             List of order IDs that were successfully placed
         """
         placed_order_ids = []
 
-        for order_spec in orders:
-            try:
-                # Place limit buy order
-                response = self.client.place_limit_buy(
+        if not orders:
+            return placed_order_ids
+
+        # One expiry for every entry so no leg outlives the others
+        expires_at = None
+        if expire_after_seconds:
+            expires_at = int(time.time()) + expire_after_seconds
+
+        # Submit all entries in one batch request
+        self._flush_output()
+        responses = self.client.place_limit_buys_batch([
+            {
+                'token_id': order_spec['token_id'],
+                'price': order_spec['price'],
+                'amount_usd': order_spec['amount_usd']
+            }
+            for order_spec in orders
+        ], expires_at=expires_at)
+        self._invalidate_open_orders()
+
+        for order_spec, response in zip(orders, responses):
+            # Batch responses report success per order
+            if response and response.get('success', True) and response.get('orderID'):
+                order_id = response['orderID']
+                placed_order_ids.append(order_id)
+
+                # Track this order
+                size = order_spec['amount_usd'] / order_spec['price']
+                self.order_monitor.add_order(
+                    order_id=order_id,
                     token_id=order_spec['token_id'],
+                    market_slug=order_spec['market_slug'],
+                    side='BUY',
                     price=order_spec['price'],
-                    amount_usdc=order_spec['amount_usd']
+                    size=size,
+                    entry_number=order_spec.get('entry_number'),
+                    strong_team_price_cents=strong_team_price_cents,
+                    expires_at=expires_at
                 )
 
-                if response and 'orderID' in response:
-                    order_id = response['orderID']
-                    placed_order_ids.append(order_id)
-
-                    # Track this order
-                    size = order_spec['amount_usd'] / order_spec['price']
-                    self.order_monitor.add_order(
-                        order_id=order_id,
-                        token_id=order_spec['token_id'],
-                        market_slug=order_spec['market_slug'],
-                        side='BUY',
-                        price=order_spec['price'],
-                        size=size,
-                        entry_number=order_spec.get('entry_number'),
-                        strong_team_price_cents=strong_team_price_cents
-                    )
-
-                    print(f"      [OK] Entry {order_spec['entry_number']}: ${order_spec['amount_usd']} @ ${order_spec['price']:.3f}")
+                self._log(f"      [OK] Entry {order_spec['entry_number']}: ${order_spec['amount_usd']} @ ${order_spec['price']:.3f}")
+            else:
+                error_msg = response.get('errorMsg') if response else None
+                if error_msg:
+                    self._log(f"      [X] Entry {order_spec['entry_number']} failed: {error_msg}")
                 else:
-                    print(f"      [X] Entry {order_spec['entry_number']} failed")
-
-            except Exception as e:
-                print(f"Error placing order: {e}")
-                continue
+                    self._log(f"      [X] Entry {order_spec['entry_number']} failed")
 
         return placed_order_ids
 
+    @_flushes_output
     def place_take_profit_orders(
         self,
         token_id: str,
@@ -98,36 +207,80 @@ class TradeExecutor:
         Returns:
             Order ID if successful, None otherwise
         """
+        spec = {
+            'token_id': token_id,
+            'market_slug': market_slug,
+            'team_name': team_name,
+            'tp_price': tp_price,
+            'position_size': position_size
+        }
+        self._flush_output()
+        response = self._submit_take_profit(spec)
+        self._invalidate_open_orders()
+
+        return self._record_take_profit(response, **spec)
+
+    def _submit_take_profit(self, spec: Dict) -> Optional[Dict]:
+        """
+        Send the limit sell for a take profit spec.
+
+        Safe to run on pool threads: errors are returned as an errorMsg
+        response and logged by the caller, not printed here.
+
+        Args:
+            spec: Take profit spec (token_id, tp_price, position_size, ...)
+
+        Returns:
+            Order response, or {'errorMsg': ...} if the request failed
+        """
         try:
-            response = self.client.place_limit_sell(
+            return self.client.place_limit_sell(
+                token_id=spec['token_id'],
+                price=spec['tp_price'],
+                size=spec['position_size']
+            )
+        except Exception as e:
+            return {'errorMsg': str(e)}
+
+    def _record_take_profit(
+        self,
+        response: Optional[Dict],
+        token_id: str,
+        market_slug: str,
+        team_name: str,
+        tp_price: Decimal,
+        position_size: Decimal
+    ) -> Optional[str]:
+        """
+        Track a placed take profit order from its CLOB response.
+
+        Returns:
+            Order ID if the order was accepted, None otherwise
+        """
+        if response and 'orderID' in response:
+            order_id = response['orderID']
+
+            # Track this order
+            self.order_monitor.add_order(
+                order_id=order_id,
                 token_id=token_id,
+                market_slug=market_slug,
+                side='SELL',
                 price=tp_price,
                 size=position_size
             )
 
-            if response and 'orderID' in response:
-                order_id = response['orderID']
-
-                # Track this order
-                self.order_monitor.add_order(
-                    order_id=order_id,
-                    token_id=token_id,
-                    market_slug=market_slug,
-                    side='SELL',
-                    price=tp_price,
-                    size=position_size
-                )
-
-                print(f"      [OK] TP: {team_name} - {position_size} shares @ ${tp_price:.3f}")
-                return order_id
-            else:
-                print(f"      [X] TP failed: {team_name}")
-                return None
+            self._log(f"      [OK] TP: {team_name} - {position_size} shares @ ${tp_price:.3f}")
+            return order_id
 
-        except Exception as e:
-            print(f"Error placing TP order: {e}")
-            return None
+        error_msg = response.get('errorMsg') if response else None
+        if error_msg:
+            self._log(f"      [X] TP failed: {team_name} - {error_msg}")
+        else:
+            self._log(f"      [X] TP failed: {team_name}")
+        return None
 
+    @_flushes_output
     def check_and_recreate_orders(self) -> int:
         """
         Check all tracked orders and recreate if disappeared.
@@ -136,32 +289,57 @@ class TradeExecutor:
             Number of orders recreated
         """
         # Get all open orders from CLOB
-        open_orders = self.client.get_open_orders()
-        open_order_ids = {order.get('id') for order in open_orders if order.get('id')}
+        open_orders = self._get_open_orders_cached()
+        open_order_ids = frozenset(order.id for order in open_orders if order.id)
 
-        # Update status for all tracked orders
-        for order_id in list(self.order_monitor.tracked_orders.keys()):
-            still_exists = order_id in open_order_ids
-            self.order_monitor.update_order_status(order_id, still_exists)
+        # Update status for all tracked orders in one pass (one save)
+        tracked_ids = self.order_monitor.tracked_orders.keys()
+        self.order_monitor.update_order_statuses(
+            present_ids=tracked_ids & open_order_ids,
+            absent_ids=tracked_ids - open_order_ids
+        )
 
         # Get disappeared orders
         disappeared = self.order_monitor.get_disappeared_orders()
 
+        # GTD orders that reached their expiration are done - never recreate or look them up
+        now = time.time()
+        expired_ids = [
+            order['order_id'] for order in disappeared
+            if order.get('expires_at') and order['expires_at'] <= now
+        ]
+        if expired_ids:
+            for order_id in expired_ids:
+                self.order_monitor.mark_order_expired(order_id)
+            self._log(f"  [!] {len(expired_ids)} GTD orders expired - not recreating")
+            disappeared = self.order_monitor.get_disappeared_orders()
+
         if not disappeared:
             return 0
 
-        print(f"  [!] {len(disappeared)} disappeared orders found - checking...")
+        self._log(f"  [!] {len(disappeared)} disappeared orders found - checking...")
 
         # BATCH CHECK: Pre-check all unique markets to avoid repeated API calls
         ended_markets = set()
         if self.market_scanner:
-            unique_markets = {order['market_slug'] for order in disappeared}
-            for market_slug in unique_markets:
-                if not self.market_scanner.is_market_active(market_slug):
-                    ended_markets.add(market_slug)
+            unique_markets = list({order['market_slug'] for order in disappeared})
+            self._flush_output()
+            # Gamma API calls - not subject to the CLOB rate limit
+            statuses = self.client.map_concurrently(
+                self.market_scanner.is_market_active, unique_markets, paced=False
+            )
+            ended_markets = {slug for slug, active in zip(unique_markets, statuses) if not active}
+
+        # BATCH CHECK: One balance lookup per unique token instead of per order
+        self._flush_output()
+        balances = self.client.get_token_balances([
+            order['token_id'] for order in disappeared
+            if order['market_slug'] not in ended_markets
+        ])
 
         recreated_count = 0
         skipped_ended_markets = 0
+        to_recreate = []
 
         for order_data in disappeared:
             try:
@@ -178,66 +356,98 @@ class TradeExecutor:
                     continue
 
                 # CHECK 2: Check if we already have position (order was filled)
-                token_id = order_data['token_id']
-                existing_balance = self.client.get_token_balance(token_id)
+                existing_balance = balances.get(order_data['token_id'], _ZERO)
 
-                if existing_balance > Decimal("0.1"):
+                if existing_balance > _MIN_POSITION:
                     # Order was filled, not disappeared - don't recreate
-                    print(f"    [!] Skipping recreate - position exists ({existing_balance} shares)")
+                    self._log(f"    [!] Skipping recreate - position exists ({existing_balance} shares)")
                     self.order_monitor.mark_order_filled(order_data['order_id'])
                     continue
 
-                # Recreate the order
-                side = order_data['side']
-                price = Decimal(order_data['price'])
-                size = Decimal(order_data['size'])
-
-                if side == 'BUY':
-                    amount_usd = price * size
-                    response = self.client.place_limit_buy(
-                        token_id=token_id,
-                        price=price,
-                        amount_usdc=amount_usd
-                    )
-                else:  # SELL
-                    response = self.client.place_limit_sell(
-                        token_id=token_id,
-                        price=price,
-                        size=size
-                    )
-
-                if response and 'orderID' in response:
-                    new_order_id = response['orderID']
-
-                    # Track new order
-                    self.order_monitor.add_order(
-                        order_id=new_order_id,
-                        token_id=token_id,
-                        market_slug=market_slug,
-                        side=side,
-                        price=price,
-                        size=size,
-                        entry_number=order_data.get('entry_number')
-                    )
-
-                    # Mark old order as recreated
-                    self.order_monitor.mark_order_recreated(
-                        order_data['order_id'],
-                        new_order_id
-                    )
-
-                    recreated_count += 1
+                to_recreate.append(order_data)
 
             except Exception as e:
-                print(f"    [X] Recreate failed: {e}")
+                self._log(f"    [X] Recreate failed: {e}")
                 continue
 
+        # Recreate orders concurrently, then record results in order
+        self._flush_output()
+        responses = self.client.map_concurrently(self._place_recreated_order, to_recreate)
+        if to_recreate:
+            self._invalidate_open_orders()
+
+        for order_data, response in zip(to_recreate, responses):
+            error_msg = response.get('errorMsg') if response else None
+            if error_msg:
+                self._log(f"    [X] Recreate failed: {error_msg}")
+
+            if response and 'orderID' in response:
+                new_order_id = response['orderID']
+
+                # Track new order
+                self.order_monitor.add_order(
+                    order_id=new_order_id,
+                    token_id=order_data['token_id'],
+                    market_slug=order_data['market_slug'],
+                    side=order_data['side'],
+                    price=to_decimal(order_data['price']),
+                    size=to_decimal(order_data['size']),
+                    entry_number=order_data.get('entry_number'),
+                    expires_at=order_data.get('expires_at')
+                )
+
+                # Mark old order as recreated
+                self.order_monitor.mark_order_recreated(
+                    order_data['order_id'],
+                    new_order_id
+                )
+
+                recreated_count += 1
+
         # Print summary
         if skipped_ended_markets > 0:
-            print(f"  [!] Skipped {skipped_ended_markets} orders from ended markets")
+            self._log(f"  [!] Skipped {skipped_ended_markets} orders from ended markets")
 
         return recreated_count
 
+    def _place_recreated_order(self, order_data: Dict) -> Optional[Dict]:
+        """
+        Place a replacement for a disappeared order.
+
+        Runs on pool threads: errors are returned as an errorMsg response
+        and logged by the caller, not printed here.
+
+        Args:
+            order_data: Tracked order data from the order monitor
+
+        Returns:
+            Order response, or {'errorMsg': ...} if the request failed
+        """
+        try:
+            token_id = order_data['token_id']
+            price = to_decimal(order_data['price'])
+            size = to_decimal(order_data['size'])
+
+            if order_data['side'] == 'BUY':
+                # GTD entries keep their original expiry (already checked as not passed)
+                return self.client.place_limit_buy(
+                    token_id=token_id,
+                    price=price,
+                    amount_usdc=price * size,
+                    expires_at=order_data.get('expires_at')
+                )
+
+            # SELL
+            return self.client.place_limit_sell(
+                token_id=token_id,
+                price=price,
+                size=size
+            )
+
+        except Exception as e:
+            return {'errorMsg': str(e)}
+
+    @_flushes_output
     def check_filled_positions_and_set_tp(
         self,
         strategy,
@@ -265,50 +475,49 @@ class TradeExecutor:
             Number of TP orders placed
         """
         tp_placed = 0
+        tp_specs = []
 
         if price_cache is None:
             price_cache = {}
 
         # STEP 1: Get ALL positions from Data API
-        print("    [1] Fetching all positions from Data API...")
+        self._log("    [1] Fetching all positions from Data API...")
+        self._flush_output()
         all_positions = self.client.get_all_positions()
 
         if not all_positions:
-            print("    No positions found")
+            self._log("    No positions found")
             return 0
 
-        print(f"    Found {len(all_positions)} positions")
+        self._log(f"    Found {len(all_positions)} positions")
 
         # STEP 2: Get ALL open orders from CLOB API
-        print("    [2] Fetching all open orders...")
-        all_open_orders = self.client.get_open_orders()
+        self._log("    [2] Fetching all open orders...")
+        self._flush_output()
+        all_open_orders = self._get_open_orders_cached()
 
         # Build a map of existing SELL orders: token_id -> total sell size
-        existing_sell_orders = {}
-        for order in all_open_orders:
-            if order.get('side') == 'SELL':
-                token_id = order.get('asset_id')
-                size = Decimal(str(order.get('original_size', 0)))
-                if token_id not in existing_sell_orders:
-                    existing_sell_orders[token_id] = Decimal("0")
-                existing_sell_orders[token_id] += size
+        _, existing_sell_orders = index_open_orders(all_open_orders)
 
-        print(f"    Found {len(existing_sell_orders)} tokens with SELL orders")
+        self._log(f"    Found {len(existing_sell_orders)} tokens with SELL orders")
 
         # STEP 3: Process each position
-        print("    [3] Processing positions...")
+        self._log("    [3] Processing positions...")
+
+        # Tracked orders grouped by market, built on first cache miss
+        active_orders_by_market = None
 
         for position in all_positions:
             try:
                 # Extract position data
                 token_id = position.get('asset')
-                position_size = Decimal(str(position.get('size', 0)))
+                position_size = to_decimal(position.get('size', 0))
                 market_slug = position.get('slug', 'unknown')
                 outcome = position.get('outcome', 'unknown')
-                avg_price = Decimal(str(position.get('avgPrice', 0)))
+                avg_price = to_decimal(position.get('avgPrice', 0))
 
                 # Skip tiny positions
-                if position_size < Decimal("0.1"):
+                if position_size < _MIN_POSITION:
                     continue
 
                 # Skip already profitable markets if specified
@@ -316,12 +525,12 @@ class TradeExecutor:
                     continue
 
                 # Check existing SELL orders for this token
-                existing_sell_size = existing_sell_orders.get(token_id, Decimal("0"))
+                existing_sell_size = existing_sell_orders.get(token_id, _ZERO)
 
                 # Calculate unsold position
                 unsold_position = position_size - existing_sell_size
 
-                if unsold_position <= Decimal("0.1"):
+                if unsold_position <= _MIN_POSITION:
                     # Already have enough sell orders
                     continue
 
@@ -332,7 +541,9 @@ class TradeExecutor:
                 if not start_price_data:
                     # Try to find from order tracking
                     # Look for BUY orders for THIS token_id to get entry price
-                    tracked_orders = self.order_monitor.get_active_orders_by_market(market_slug)
+                    if active_orders_by_market is None:
+                        active_orders_by_market = self.order_monitor.get_active_orders_grouped_by_market()
+                    tracked_orders = active_orders_by_market.get(market_slug, [])
                     strong_team_price_cents = None
                     entry_price = None
                     filled_entry_numbers = set()
@@ -344,7 +555,7 @@ class TradeExecutor:
 
                         # If this order is for our token, get the entry price and entry number
                         if order_data.get('token_id') == token_id and order_data.get('side') == 'BUY':
-                            entry_price = Decimal(str(order_data.get('price', 0)))
+                            entry_price = to_decimal(order_data.get('price', 0))
                             if order_data.get('entry_number'):
                                 filled_entry_numbers.add(order_data.get('entry_number'))
 
@@ -357,23 +568,23 @@ class TradeExecutor:
 
                 if not start_price_data:
                     # No cached price - skip this position (let user manage manually)
-                    print(f"      [!] No cached price for {outcome} in {market_slug} - skipping (manual management)")
+                    self._log(f"      [!] No cached price for {outcome} in {market_slug} - skipping (manual management)")
                     continue
 
                 # Get strong team price and entry price for TP calculation
                 strong_team_price_cents = start_price_data.get('strong_team_price_cents')
-                entry_price = Decimal(str(start_price_data.get('price', 0)))
+                entry_price = to_decimal(start_price_data.get('price', 0))
                 entry_price_cents = float(entry_price * 100)
 
                 if not strong_team_price_cents:
-                    print(f"      [!] No strong team price for {outcome} in {market_slug} - skipping")
+                    self._log(f"      [!] No strong team price for {outcome} in {market_slug} - skipping")
                     continue
 
                 strong_price_cents = float(strong_team_price_cents)
 
                 # Rule: If strong team > 75 cents, no TP (run to resolution)
                 if strong_price_cents > 75:
-                    print(f"      [!] {outcome}: Strong team @ {strong_price_cents:.1f}c > 75c - no TP, run to resolution")
+                    self._log(f"      [!] {outcome}: Strong team @ {strong_price_cents:.1f}c > 75c - no TP, run to resolution")
                     continue
 
                 # STEP 5: Apply TP strategy based on strong team price
@@ -384,13 +595,13 @@ class TradeExecutor:
                     # Determine if this is strong or weak team based on entry price
                     # Strong team entry = 25¢, Weak team entry = 22¢
                     if entry_price_cents >= 24:  # Strong team (entry ~25¢)
-                        tp_price = Decimal(str(strong_price_cents)) / Decimal("100") - Decimal("0.02")
-                        print(f"      [BALANCED] {outcome} is STRONG team, TP = {strong_price_cents:.1f}c - 2c")
+                        tp_price = cents_to_price(strong_price_cents - 2)
+                        self._log(f"      [BALANCED] {outcome} is STRONG team, TP = {strong_price_cents:.1f}c - 2c")
                     else:  # Weak team (entry ~22¢)
                         # TP = 102 - strong_price (in cents), then convert to decimal
                         tp_price_cents = 102 - strong_price_cents
-                        tp_price = Decimal(str(tp_price_cents)) / Decimal("100")
-                        print(f"      [BALANCED] {outcome} is WEAK team, TP = 102 - {strong_price_cents:.1f}c = {tp_price_cents:.1f}c")
+                        tp_price = cents_to_price(tp_price_cents)
+                        self._log(f"      [BALANCED] {outcome} is WEAK team, TP = 102 - {strong_price_cents:.1f}c = {tp_price_cents:.1f}c")
 
                 # NON-BALANCED MATCH: Strong 61-75¢
                 else:
@@ -399,35 +610,42 @@ class TradeExecutor:
                     num_entries_filled = len(filled_entries)
 
                     if num_entries_filled < 2:
-                        print(f"      [!] {outcome}: Only {num_entries_filled} entry filled - no TP, run to resolution")
+                        self._log(f"      [!] {outcome}: Only {num_entries_filled} entry filled - no TP, run to resolution")
                         continue
 
                     # Both entries filled: TP at strong team's start price - 2 cents
-                    tp_price = Decimal(str(strong_price_cents)) / Decimal("100") - Decimal("0.02")
-
-                print(f"\n      Position: {outcome} ({market_slug})")
-                print(f"        Size: {position_size:.2f} | SELL: {existing_sell_size:.2f} | Unsold: {unsold_position:.2f}")
-                print(f"        TP Price: ${tp_price:.3f}")
-
-                # Place TP order for unsold position
-                tp_order_id = self.place_take_profit_orders(
-                    token_id=token_id,
-                    market_slug=market_slug,
-                    team_name=outcome,
-                    tp_price=tp_price,
-                    position_size=unsold_position
-                )
-
-                if tp_order_id:
-                    tp_placed += 1
-                    # Update existing_sell_orders to avoid duplicate
-                    existing_sell_orders[token_id] = existing_sell_orders.get(token_id, Decimal("0")) + unsold_position
+                    tp_price = cents_to_price(strong_price_cents - 2)
+
+                self._log(f"\n      Position: {outcome} ({market_slug})")
+                self._log(f"        Size: {position_size:.2f} | SELL: {existing_sell_size:.2f} | Unsold: {unsold_position:.2f}")
+                self._log(f"        TP Price: ${tp_price:.3f}")
+
+                # Queue TP order for unsold position
+                tp_specs.append({
+                    'token_id': token_id,
+                    'market_slug': market_slug,
+                    'team_name': outcome,
+                    'tp_price': tp_price,
+                    'position_size': unsold_position
+                })
+                # Update existing_sell_orders to avoid duplicate
+                existing_sell_orders[token_id] = existing_sell_orders.get(token_id, _ZERO) + unsold_position
 
             except Exception as e:
-                print(f"      [X] Error processing position: {e}")
+                self._log(f"      [X] Error processing position: {e}")
                 continue
 
+        # Place TP orders for unsold positions concurrently, then track them
+        self._flush_output()
+        responses = self.client.map_concurrently(self._submit_take_profit, tp_specs)
+        if tp_specs:
+            self._invalidate_open_orders()
+
+        for spec, response in zip(tp_specs, responses):
+            if self._record_take_profit(response, **spec):
+                tp_placed += 1
+
         # STEP 6: Final verification
-        print(f"\n    [4] Summary: Placed {tp_placed} TP orders")
+        self._log(f"\n    [4] Summary: Placed {tp_placed} TP orders")
 
         return tp_placed
@@ -3,12 +3,15 @@ Order Monitor - Monitor open orders and recreate if disappeared
 Polymarket has an issue where limit orders can disappear before match starts
 """
 
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterable, List, Set, Optional
 from decimal import Decimal
 from datetime import datetime, timedelta
 import json
 import os
 
+# Statuses of orders that are still expected to be resting on the book
+ACTIVE_STATUSES = ('active', 'disappeared')
+
 
 class OrderMonitor:
     """
@@ -25,6 +28,12 @@ class OrderMonitor:
         self.storage_file = storage_file
         self.tracked_orders = self._load_tracked_orders()
 
+        # Index of status -> order IDs (dicts keep insertion order), so per-tick
+        # queries only touch orders in the statuses they ask for
+        self._ids_by_status: Dict[str, Dict[str, None]] = {}
+        for order_id, order_data in self.tracked_orders.items():
+            self._ids_by_status.setdefault(order_data['status'], {})[order_id] = None
+
     def _load_tracked_orders(self) -> Dict:
         """Load tracked orders from storage file."""
         if not os.path.exists(self.storage_file):
@@ -48,6 +57,32 @@ class OrderMonitor:
         except Exception as e:
             print(f"Error saving tracked orders: {e}")
 
+    def _set_status(self, order_id: str, status: str):
+        """Set an order's status and keep the status index in sync."""
+        order = self.tracked_orders[order_id]
+        old_status = order.get('status')
+        if old_status == status:
+            return
+
+        if old_status in self._ids_by_status:
+            self._ids_by_status[old_status].pop(order_id, None)
+        self._ids_by_status.setdefault(status, {})[order_id] = None
+        order['status'] = status
+
+    def _delete_order(self, order_id: str):
+        """Delete an order from tracking and from the status index."""
+        order = self.tracked_orders.pop(order_id)
+        if order.get('status') in self._ids_by_status:
+            self._ids_by_status[order['status']].pop(order_id, None)
+
+    def _ids_with_status(self, *statuses: str) -> List[str]:
+        """Get IDs of tracked orders in any of the given statuses."""
+        return [
+            order_id
+            for status in statuses
+            for order_id in self._ids_by_status.get(status, ())
+        ]
+
     def add_order(
         self,
         order_id: str,
@@ -57,7 +92,8 @@ class OrderMonitor:
         price: Decimal,
         size: Decimal,
         entry_number: Optional[int] = None,
-        strong_team_price_cents: Optional[float] = None
+        strong_team_price_cents: Optional[float] = None,
+        expires_at: Optional[int] = None
     ):
         """
         Add an order to tracking.
@@ -71,6 +107,7 @@ class OrderMonitor:
             size: Order size
             entry_number: Entry number (1 or 2) for buy orders
             strong_team_price_cents: Strong team price when entry was placed (for TP calculation)
+            expires_at: Unix timestamp when a GTD order expires (None for GTC)
         """
         order_data = {
             'order_id': order_id,
@@ -81,13 +118,17 @@ class OrderMonitor:
             'size': str(size),
             'entry_number': entry_number,
             'strong_team_price_cents': strong_team_price_cents,
+            'expires_at': expires_at,
             'created_at': datetime.now().isoformat(),
             'last_seen': datetime.now().isoformat(),
             'disappeared_count': 0,
             'status': 'active'
         }
 
+        if order_id in self.tracked_orders:
+            self._delete_order(order_id)
         self.tracked_orders[order_id] = order_data
+        self._ids_by_status.setdefault('active', {})[order_id] = None
         self._save_tracked_orders()
 
     def update_order_status(
@@ -114,14 +155,41 @@ class OrderMonitor:
             order['last_seen'] = datetime.now().isoformat()
             order['disappeared_count'] = 0
             if current_status:
-                order['status'] = current_status
-        else:
-            # Order disappeared
+                self._set_status(order_id, current_status)
+        elif order['status'] in ACTIVE_STATUSES:
+            # Order disappeared (filled/expired/recreated orders are already done)
             order['disappeared_count'] += 1
 
             # Mark as disappeared if not seen
             if order['disappeared_count'] >= 1:
-                order['status'] = 'disappeared'
+                self._set_status(order_id, 'disappeared')
+
+        self._save_tracked_orders()
+
+    def update_order_statuses(self, present_ids: Iterable[str], absent_ids: Iterable[str]):
+        """
+        Update status for many orders at once and save tracking a single time.
+
+        Same per-order effect as update_order_status(order_id, True/False).
+
+        Args:
+            present_ids: Order IDs still in open orders
+            absent_ids: Order IDs no longer in open orders
+        """
+        now = datetime.now().isoformat()
+
+        for order_id in present_ids:
+            order = self.tracked_orders.get(order_id)
+            if order is not None:
+                order['last_seen'] = now
+                order['disappeared_count'] = 0
+
+        for order_id in absent_ids:
+            order = self.tracked_orders.get(order_id)
+            # Filled/expired/recreated orders are done - don't mark them disappeared again
+            if order is not None and order['status'] in ACTIVE_STATUSES:
+                order['disappeared_count'] += 1
+                self._set_status(order_id, 'disappeared')
 
         self._save_tracked_orders()
 
@@ -132,18 +200,18 @@ class OrderMonitor:
         Returns:
             List of disappeared order data
         """
-        disappeared = []
-
-        for order_id, order_data in self.tracked_orders.items():
-            if order_data['status'] == 'disappeared':
-                disappeared.append(order_data)
-
-        return disappeared
+        return [self.tracked_orders[order_id] for order_id in self._ids_with_status('disappeared')]
 
     def mark_order_filled(self, order_id: str):
         """Mark order as filled/completed."""
         if order_id in self.tracked_orders:
-            self.tracked_orders[order_id]['status'] = 'filled'
+            self._set_status(order_id, 'filled')
+            self._save_tracked_orders()
+
+    def mark_order_expired(self, order_id: str):
+        """Mark a GTD order as expired (not to be recreated)."""
+        if order_id in self.tracked_orders:
+            self._set_status(order_id, 'expired')
             self._save_tracked_orders()
 
     def mark_order_recreated(self, old_order_id: str, new_order_id: str):
@@ -156,7 +224,7 @@ class OrderMonitor:
         """
         if old_order_id in self.tracked_orders:
             old_order = self.tracked_orders[old_order_id]
-            old_order['status'] = 'recreated'
+            self._set_status(old_order_id, 'recreated')
             old_order['recreated_as'] = new_order_id
             self._save_tracked_orders()
 
@@ -169,7 +237,7 @@ class OrderMonitor:
             order_id: Order ID to remove
         """
         if order_id in self.tracked_orders:
-            del self.tracked_orders[order_id]
+            self._delete_order(order_id)
             self._save_tracked_orders()
 
     def get_active_orders_by_market(self, market_slug: str) -> List[Dict]:
@@ -184,13 +252,31 @@ class OrderMonitor:
         """
         active_orders = []
 
-        for order_id, order_data in self.tracked_orders.items():
-            if (order_data['market_slug'] == market_slug and
-                order_data['status'] in ['active', 'disappeared']):
+        for order_id in self._ids_with_status(*ACTIVE_STATUSES):
+            order_data = self.tracked_orders[order_id]
+            if order_data['market_slug'] == market_slug:
                 active_orders.append(order_data)
 
         return active_orders
 
+    def get_active_orders_grouped_by_market(self) -> Dict[str, List[Dict]]:
+        """
+        Get all active orders grouped by market in a single pass.
+
+        Use this instead of repeated get_active_orders_by_market calls when
+        looking up many markets at once.
+
+        Returns:
+            Dict of market_slug -> list of active orders
+        """
+        grouped: Dict[str, List[Dict]] = {}
+
+        for order_id in self._ids_with_status(*ACTIVE_STATUSES):
+            order_data = self.tracked_orders[order_id]
+            grouped.setdefault(order_data['market_slug'], []).append(order_data)
+
+        return grouped
+
     def should_check_before_match(self, match_start_time: datetime) -> bool:
         """
         Check if we should verify orders (within 5 minutes of match start).
@@ -214,13 +300,10 @@ class OrderMonitor:
         Returns:
             Set of market slugs
         """
-        markets = set()
-
-        for order_data in self.tracked_orders.values():
-            if order_data['status'] in ['active', 'disappeared']:
-                markets.add(order_data['market_slug'])
-
-        return markets
+        return {
+            self.tracked_orders[order_id]['market_slug']
+            for order_id in self._ids_with_status(*ACTIVE_STATUSES)
+        }
 
     def cleanup_old_orders(self, days_old: int = 7):
         """
@@ -232,16 +315,18 @@ class OrderMonitor:
         cutoff_date = datetime.now() - timedelta(days=days_old)
         orders_to_remove = []
 
-        for order_id, order_data in self.tracked_orders.items():
-            created_at = datetime.fromisoformat(order_data['created_at'])
+        inactive_statuses = [status for status in self._ids_by_status if status not in ACTIVE_STATUSES]
+
+        # Only completed/cancelled orders are candidates
+        for order_id in self._ids_with_status(*inactive_statuses):
+            created_at = datetime.fromisoformat(self.tracked_orders[order_id]['created_at'])
 
-            # Remove if old and not active
-            if (created_at < cutoff_date and
-                order_data['status'] not in ['active', 'disappeared']):
+            # Remove if old
+            if created_at < cutoff_date:
                 orders_to_remove.append(order_id)
 
         for order_id in orders_to_remove:
-            del self.tracked_orders[order_id]
+            self._delete_order(order_id)
 
         if orders_to_remove:
             print(f"Cleaned up {len(orders_to_remove)} old orders")
@@ -4,6 +4,7 @@ Market Scanner - Scan and filter LOL markets on Polymarket
 
 import requests
 import json
+import time
 from typing import List, Dict, Optional
 from decimal import Decimal
 from datetime import datetime, timedelta, timezone
@@ -17,6 +18,11 @@ class MarketScanner:
         self.gamma_api_url = gamma_api_url
         self.min_event_volume = Decimal("1000")  # Minimum event volume to consider (lowered from 10000)
         self.price_cache = PriceCache()
+        # Market status cache: slug -> active flag. Ended is terminal, so a
+        # False entry never expires; True entries are rechecked after the TTL.
+        self.active_cache_ttl_seconds = 30
+        self._active_cache: Dict[str, bool] = {}
+        self._active_checked_at: Dict[str, float] = {}
 
     def scan_lol_markets(
         self,
@@ -119,6 +125,7 @@ class MarketScanner:
 
                     # Skip if match already ended
                     if end_date < now:
+                        self.mark_market_ended(market.get('slug', ''))
                         continue
 
                     # Use actual game start time
@@ -350,16 +357,36 @@ class MarketScanner:
             print(f"Error fetching market {slug}: {e}")
             return None
 
+    def mark_market_ended(self, slug: str):
+        """
+        Record that a market has ended so later status checks skip the API.
+
+        Args:
+            slug: Market slug
+        """
+        if slug:
+            self._active_cache[slug] = False
+            self._active_checked_at[slug] = time.monotonic()
+
     def is_market_active(self, slug: str) -> bool:
         """
         Check if a market is still active (not ended).
 
+        Ended markets are cached permanently; active results are reused for
+        active_cache_ttl_seconds before the API is queried again.
+
         Args:
             slug: Market slug or condition_id
 
         Returns:
             True if market is active, False if ended or error
         """
+        cached = self._active_cache.get(slug)
+        if cached is False:
+            return False
+        if cached and time.monotonic() - self._active_checked_at[slug] < self.active_cache_ttl_seconds:
+            return True
+
         try:
             market_data = self.get_market_details(slug)
             if not market_data:
@@ -368,11 +395,16 @@ class MarketScanner:
             # Check endDate
             end_date_str = market_data.get('endDate', None)
             if not end_date_str:
-                return True  # No endDate means active
-
-            # Parse and check if ended
-            end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-            return end_date > datetime.now(timezone.utc)
+                active = True  # No endDate means active
+            else:
+                # Parse and check if ended
+                end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
+                active = end_date > datetime.now(timezone.utc)
+
+            # Only cache definite answers - errors above are retried next time
+            self._active_cache[slug] = active
+            self._active_checked_at[slug] = time.monotonic()
+            return active
 
         except Exception as e:
             print(f"Error checking market status for {slug}: {e}")
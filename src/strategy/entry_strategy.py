@@ -3,8 +3,13 @@ Entry Strategy - Determine entry points based on strong team price
 Implements the strategy table with limit entry prices
 """
 
+import math
 from decimal import Decimal
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from src.utils.decimal_utils import cents_to_price, to_decimal
+
+_HUNDRED = Decimal("100")
 
 
 class EntryStrategy:
@@ -20,17 +25,24 @@ class EntryStrategy:
     - Price 80+:   Entry 1 at 67¢, Entry 2 at 54¢
     """
 
-    # Strategy table: (min_price, max_price) -> (entry1, entry2)
+    # Strategy table: (min_price, max_price, entry1, entry2)
     # Ranges are inclusive on both ends and cover decimals (e.g., 79.5 matches 75-80 range)
-    STRATEGY_TABLE = {
-        (0, 60): (25, 22),  # Balanced matches: Strong ≤60¢ → Strong @25¢, Weak @22¢
-        (61, 63.99): (41, 26),
-        (64, 66.99): (43, 30),
-        (67, 69.99): (44, 32),
-        (70, 74.99): (51, 37),
-        (75, 79.99): (57, 41),
-        (80, 100): (67, 54),  # 80+ means up to 100
-    }
+    STRATEGY_TABLE: Tuple[Tuple[float, float, int, int], ...] = (
+        (0, 60, 25, 22),  # Balanced matches: Strong ≤60¢ → Strong @25¢, Weak @22¢
+        (61, 63.99, 41, 26),
+        (64, 66.99, 43, 30),
+        (67, 69.99, 44, 32),
+        (70, 74.99, 51, 37),
+        (75, 79.99, 57, 41),
+        (80, 100, 67, 54),  # 80+ means up to 100
+    )
+
+    # Same rows with entry prices converted to Decimal once at import:
+    # (min_price, max_price, entry1_cents, entry1_price, entry2_cents, entry2_price)
+    _STRATEGY_ROWS: Tuple[Tuple[float, float, int, Decimal, int, Decimal], ...] = tuple(
+        (min_price, max_price, entry1, to_decimal(entry1) / _HUNDRED, entry2, to_decimal(entry2) / _HUNDRED)
+        for min_price, max_price, entry1, entry2 in STRATEGY_TABLE
+    )
 
     def __init__(self, entry_size_usd: Decimal = Decimal("3.5")):
         """
@@ -40,8 +52,35 @@ class EntryStrategy:
             entry_size_usd: Size of each entry in USD (default $3.5)
         """
         self.entry_size_usd = entry_size_usd
+        self._entry_lut = self._build_entry_lut()
+
+    def _build_entry_lut(self) -> List[Optional[Tuple[float, float, Mapping]]]:
+        """
+        Precompute entry configs indexed by whole-cent strong team price.
 
-    def get_entry_prices(self, strong_team_price_cents: float) -> Optional[Dict]:
+        Each slot holds the (min_price, max_price, config) row covering that
+        cent, so lookups are a single index plus a bounds check. Configs are
+        read-only and shared between calls.
+
+        Returns:
+            List of 101 rows (None where no strategy applies)
+        """
+        lut: List[Optional[Tuple[float, float, Mapping]]] = [None] * 101
+
+        for min_price, max_price, entry1, entry1_price, entry2, entry2_price in self._STRATEGY_ROWS:
+            config = MappingProxyType({
+                'entry1_cents': entry1,
+                'entry1_price': entry1_price,
+                'entry2_cents': entry2,
+                'entry2_price': entry2_price,
+                'entry_size_usd': self.entry_size_usd
+            })
+            for cents in range(int(min_price), int(max_price) + 1):
+                lut[cents] = (min_price, max_price, config)
+
+        return lut
+
+    def get_entry_prices(self, strong_team_price_cents: float) -> Optional[Mapping]:
         """
         Get entry prices for weak team based on strong team price.
 
@@ -49,18 +88,24 @@ class EntryStrategy:
             strong_team_price_cents: Strong team price in cents (e.g., 65.5)
 
         Returns:
-            Dict with entry1 and entry2 prices in cents, or None if no strategy
+            Read-only mapping with entry1 and entry2 prices in cents, or None if no strategy
         """
-        # Find matching price range
-        for (min_price, max_price), (entry1, entry2) in self.STRATEGY_TABLE.items():
-            if min_price <= strong_team_price_cents <= max_price:
-                return {
-                    'entry1_cents': entry1,
-                    'entry1_price': Decimal(str(entry1)) / Decimal("100"),
-                    'entry2_cents': entry2,
-                    'entry2_price': Decimal(str(entry2)) / Decimal("100"),
-                    'entry_size_usd': self.entry_size_usd
-                }
+        # NaN/inf prices can't be bucketed (int() raises) - no strategy
+        if not math.isfinite(strong_team_price_cents):
+            return None
+
+        idx = int(strong_team_price_cents)
+        if not 0 <= idx <= 100:
+            return None
+
+        row = self._entry_lut[idx]
+        if row is None:
+            return None
+
+        # Ranges leave small gaps (e.g. 60-61, 63.99-64), keep them unmatched
+        min_price, max_price, config = row
+        if min_price <= strong_team_price_cents <= max_price:
+            return config
 
         # No strategy for this price range
         return None
@@ -162,33 +207,33 @@ class EntryStrategy:
         Returns:
             List of TP order specs with price and size (empty list = no TP)
         """
-        tp_orders = []
-
-        # Determine which entries were filled
-        entry_numbers = {e['entry_number'] for e in filled_entries}
-        num_entries_filled = len(entry_numbers)
-
         # Check strong team price
         if strong_team_start_price_cents > 70:
             # Strong > 70¢: NO TP, run to resolution
             return []
 
-        # Strong ≤ 70¢
-        if num_entries_filled == 1:
-            # Only 1 entry filled: NO TP, run to resolution
-            return []
+        # Strong ≤ 70¢: dispatch on which entries were filled (bit 1 = entry 1, bit 2 = entry 2)
+        filled_mask = 0
+        for e in filled_entries:
+            filled_mask |= self._ENTRY_BITS.get(e['entry_number'], 0)
 
-        elif num_entries_filled >= 2:
-            # Both entries filled: TP 100% at start price
-            strong_start_decimal = Decimal(str(strong_team_start_price_cents)) / Decimal("100")
+        return self._TP_HANDLERS[filled_mask](self, strong_team_start_price_cents, total_position_size)
 
-            tp_orders.append({
-                'price': strong_start_decimal,
-                'size': total_position_size,  # 100% of position
-                'label': 'TP (100% at start price)'
-            })
+    def _no_take_profit(self, strong_team_start_price_cents: float, total_position_size: Decimal) -> List[Dict]:
+        """No entry or only 1 entry filled: NO TP, run to resolution."""
+        return []
+
+    def _take_profit_at_start_price(self, strong_team_start_price_cents: float, total_position_size: Decimal) -> List[Dict]:
+        """Both entries filled: TP 100% at start price."""
+        return [{
+            'price': cents_to_price(strong_team_start_price_cents),
+            'size': total_position_size,  # 100% of position
+            'label': 'TP (100% at start price)'
+        }]
 
-        return tp_orders
+    # Filled-entries bitmask -> TP handler: none, entry 1, entry 2, both
+    _ENTRY_BITS = {1: 1, 2: 2}
+    _TP_HANDLERS = (_no_take_profit, _no_take_profit, _no_take_profit, _take_profit_at_start_price)
 
     def get_take_profit_price(
         self,
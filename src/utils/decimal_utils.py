@@ -0,0 +1,51 @@
+"""
+Decimal helpers - Memoized conversion for prices and sizes
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Union
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _to_decimal_cached(value: Union[str, int, float]) -> Decimal:
+    """Convert via str() so floats keep their short repr (0.1 -> Decimal('0.1'))."""
+    return Decimal(str(value))
+
+
+def to_decimal(value: Union[str, int, float, Decimal]) -> Decimal:
+    """
+    Convert a number or numeric string to Decimal.
+
+    Same result as Decimal(str(value)), but repeated values (prices, sizes)
+    are served from a cache instead of being re-formatted and re-parsed.
+
+    Args:
+        value: Number, numeric string or Decimal
+
+    Returns:
+        Decimal value (Decimal inputs are returned unchanged)
+    """
+    if isinstance(value, Decimal):
+        return value
+    return _to_decimal_cached(value)
+
+
+_HUNDRED = Decimal("100")
+
+
+def cents_to_price(cents: Union[int, float]) -> Decimal:
+    """
+    Convert a price in cents to a Decimal price (e.g. 63.5 -> Decimal('0.635')).
+
+    Do arithmetic in cents first (e.g. start price - 2) and convert once.
+    The input is rounded to 1/100 cent so float noise like 46.699999999999996
+    does not end up in an order price.
+
+    Args:
+        cents: Price in cents
+
+    Returns:
+        Price as Decimal (0.0 to 1.0)
+    """
+    return to_decimal(round(cents, 2)) / _HUNDRED
@@ -1,9 +1,13 @@
 """
 Debug script to check market parsing for G2 vs GIANTX
 """
-import json
 import requests
 
+try:
+    import orjson as json  # C-accelerated parser, same loads() API
+except ImportError:
+    import json
+
 # Fetch G2 vs GIANTX market directly from Gamma API
 url = "https://gamma-api.polymarket.com/events"
 params = {
@@ -14,7 +18,7 @@ params = {
 }
 
 response = requests.get(url, params=params)
-markets_data = response.json()
+markets_data = json.loads(response.content)
 
 # Find G2 vs GIANTX
 for event in markets_data:
@@ -45,3 +49,7 @@ for event in markets_data:
                 print(f"Weak team (lower price): {outcomes[0]} @ {float(prices[0]) * 100:.1f}¢")
 
             break
+    else:
+        continue
+    # Match found - stop scanning remaining events
+    break
@@ -9,14 +9,14 @@ import json
 import os
 from decimal import Decimal
 from datetime import datetime
-from typing import Set, Dict
+from typing import Set, Dict, Optional
 
 from src.api.polymarket_client import create_client_from_env
 from src.scanner.market_scanner import MarketScanner
 from src.strategy.entry_strategy import EntryStrategy
 from src.monitor.order_monitor import OrderMonitor
 from src.storage.market_queue import MarketQueue
-from src.execution.trade_executor import TradeExecutor
+from src.execution.trade_executor import TradeExecutor, index_open_orders
 
 
 class LOLTradingBot:
@@ -30,7 +30,8 @@ class LOLTradingBot:
         entry_size_usd: Decimal = Decimal("3.5"),
         min_volume_usd: Decimal = Decimal("1000"),
         max_total_price: Decimal = Decimal("110"),
-        min_strong_team_price: Decimal = Decimal("60")
+        min_strong_team_price: Decimal = Decimal("60"),
+        entry_expire_after_seconds: Optional[int] = None
     ):
         """
         Initialize trading bot.
@@ -41,6 +42,8 @@ class LOLTradingBot:
             min_volume_usd: Minimum market volume (default $1000)
             max_total_price: Maximum total price of both teams (default 110¢)
             min_strong_team_price: Minimum strong team price (default 60¢)
+            entry_expire_after_seconds: If set, entry orders are GTD and stop resting
+                                        this many seconds after placement (default None = GTC)
         """
         print("="*70)
         print("LOL TRADING BOT - Initializing")
@@ -59,6 +62,7 @@ class LOLTradingBot:
         self.min_volume_usd = min_volume_usd
         self.max_total_price = max_total_price
         self.min_strong_team_price = min_strong_team_price
+        self.entry_expire_after_seconds = entry_expire_after_seconds
 
         # Track markets where we already took profit manually
         self.already_profitable_markets: Set[str] = set()
@@ -75,6 +79,8 @@ class LOLTradingBot:
         print(f"  - Min volume: ${min_volume_usd}")
         print(f"  - Max total price: {max_total_price}¢")
         print(f"  - Min strong team price: {min_strong_team_price}¢")
+        if entry_expire_after_seconds:
+            print(f"  - Entry orders expire after: {entry_expire_after_seconds}s (GTD)")
 
     def _load_price_cache(self) -> Dict:
         """Load price cache from file."""
@@ -176,6 +182,7 @@ class LOLTradingBot:
 
         # Get open orders once for efficiency
         all_open_orders = self.client.get_open_orders()
+        open_buy_count_by_asset, _ = index_open_orders(all_open_orders)
 
         for market in markets:
             slug = market['slug']
@@ -190,12 +197,16 @@ class LOLTradingBot:
                 )
 
             # Check for existing open orders for this token (fast check first)
-            has_open_order = any(
-                order.get('asset_id') == strong_team_token_id and order.get('side') == 'BUY'
-                for order in all_open_orders
-            )
+            if open_buy_count_by_asset[strong_team_token_id]:
+                self.market_queue.mark_market_entered(slug)
+                continue
 
-            if has_open_order:
+            # Calculate orders (skips markets outside the strategy table before any API calls)
+            orders = self.strategy.calculate_orders(market)
+
+            if not orders:
+                print(f"\n  -> {market['question'][:60]}...")
+                print(f"    [X] No valid entry strategy")
                 self.market_queue.mark_market_entered(slug)
                 continue
 
@@ -209,19 +220,12 @@ class LOLTradingBot:
             # PLACE ORDERS (no position, no open orders)
             print(f"\n  -> {market['question'][:60]}...")
 
-            # Calculate orders
-            orders = self.strategy.calculate_orders(market)
-
-            if not orders:
-                print(f"    [X] No valid entry strategy")
-                self.market_queue.mark_market_entered(slug)
-                continue
-
             # Place orders
             strong_price_cents = market['strong_team']['price_cents']
             order_ids = self.executor.place_entry_orders(
                 orders=orders,
-                strong_team_price_cents=strong_price_cents
+                strong_team_price_cents=strong_price_cents,
+                expire_after_seconds=self.entry_expire_after_seconds
             )
 
             if order_ids:
@@ -317,7 +321,8 @@ def main():
         entry_size_usd=Decimal("3.5"),
         min_volume_usd=Decimal("1000"),
         max_total_price=Decimal("110"),
-        min_strong_team_price=Decimal("0")  # Allow balanced matches (≤60¢)
+        min_strong_team_price=Decimal("0"),  # Allow balanced matches (≤60¢)
+        entry_expire_after_seconds=None  # Set (e.g. 3600) to place entries as GTD
     )
 
     # Add any markets where you've already taken profit manually